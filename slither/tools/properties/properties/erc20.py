@@ -70,13 +70,13 @@ def generate_erc20(
     :return:
     """
     if contract.compilation_unit.core.crytic_compile is None:
-        logging.error("Please compile with crytic-compile")
+        logger.error("Please compile with crytic-compile")
         return
     if contract.compilation_unit.core.crytic_compile.type not in [
         PlatformType.TRUFFLE,
         PlatformType.SOLC,
     ]:
-        logging.error(
+        logger.error(
             f"{contract.compilation_unit.core.crytic_compile.type} not yet supported by slither-prop"
         )
         return
@@ -157,13 +157,16 @@ def _initialization_recommendation(type_property: str) -> str:
     return content
 
 
+_PLATFORM_TO_OUTPUT_DIR = {
+    PlatformType.TRUFFLE: lambda target: Path(target, "contracts", "crytic"),
+    PlatformType.SOLC: lambda target: Path(target).parent,
+}
+
+
 # TODO: move this to crytic-compile
 def _platform_to_output_dir(platform: AbstractPlatform) -> Path:
-    if platform.TYPE == PlatformType.TRUFFLE:
-        return Path(platform.target, "contracts", "crytic")
-    if platform.TYPE == PlatformType.SOLC:
-        return Path(platform.target).parent
-    return Path()
+    builder = _PLATFORM_TO_OUTPUT_DIR.get(platform.TYPE)
+    return builder(platform.target) if builder else Path()
 
 
 def _check_compatibility(contract):